@@ -25,26 +25,47 @@ __status__ = "Development"
 
 from abc import ABC, abstractmethod
 from argparse import ArgumentParser, Namespace
-from typing import Any, TypeVar
+from itertools import repeat
+from typing import Any, Callable, Iterable, TypeVar
+import functools
 import os
-import pathlib
 import re
-import matplotlib.pyplot as plt # type: ignore
+import threading
 import numpy as np
+import numpy.typing as npt
 
 EXPORT_DIR = "export"
+PNG_COMPRESS_LEVEL = 1
 
-def add(one: int, two: int) -> bool:
-    '''
-    Add two numbers
+_DIRS_CREATED: set[str] = set()
+
+# Cached figures are shared, so only one thread may draw at a time
+_RENDER_LOCK = threading.Lock()
+
+_CODABAR_RE = re.compile(r'[0-9\-\$\:\.\+\/]+\Z')
+_UPC_RE = re.compile(r'[0-9]{11,12}\Z')
+_CODABAR_STRIP = str.maketrans('', '', 'ABCD')
+# Codabar data may contain '/', which must not end up as a directory in a filename
+_FILENAME_SAFE = str.maketrans({sep: '_' for sep in ('/', os.sep)})
+
+def create_dir(path: str) -> None:
     '''
-    return one > two
+    Creates a directory (and its parents), only touching the filesystem the first time
+    a given path is seen.
 
-foo: bool = add(1, 2)
+    Parameters
+    ----------
+        path : str
+            Directory to create
+    '''
+    if path not in _DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_CREATED.add(path)
 
-def str_to_digits(value: str) -> list[int]:
+def str_to_digits(value: str) -> npt.NDArray[np.uint8]:
     '''
-    Converts a string of digits to a list of integers.
+    Converts a string of digits to an array of integers.
+    Use `.tolist()` on the result if a list[int] is needed.
 
     Parameters
     ----------
@@ -53,10 +74,10 @@ def str_to_digits(value: str) -> list[int]:
 
     Returns
     -------
-        list[int]
+        npt.NDArray[np.uint8]
             The digits as integers
     '''
-    return [int(digit) for digit in list(value)]
+    return np.frombuffer(value.encode('ascii'), dtype=np.uint8) - ord('0')
 
 class Barcode(ABC):
     """
@@ -72,6 +93,8 @@ class Barcode(ABC):
             barcode name
     """
 
+    __slots__ = ('_data', '_options', '_name')
+
     def __init__(self, data: str, options: dict[str, Any], name: str):
         self._data = data
         self._options = options
@@ -136,6 +159,17 @@ class Barcode(ABC):
                 The encoded data
         '''
 
+    def encode_array(self) -> npt.NDArray[np.uint8]:
+        '''
+        Encodes the data into a NumPy array of binary digits.
+
+        Returns
+        -------
+            npt.NDArray[np.uint8]
+                The encoded data
+        '''
+        return str_to_digits(self.encode())
+
 # See:
 # - https://lindell.me/JsBarcode/
 # - https://github.com/lindell/JsBarcode/tree/master/src/barcodes
@@ -163,6 +197,150 @@ CODABAR_DICT = {
     'D': "1010011001"
 }
 
+CODABAR_NP = {
+    key: np.frombuffer(value.encode('ascii'), dtype=np.uint8) - ord('0')
+    for key, value in CODABAR_DICT.items()
+}
+
+# Lookup tables indexed by byte value, avoiding a dict hash per symbol
+_CODABAR_LUT: list[str] = [""] * 256
+for _key, _value in CODABAR_DICT.items():
+    _CODABAR_LUT[ord(_key)] = _value
+
+# Flat lookup tables for the compiled encoder: bit patterns padded with 255, and their lengths
+_CODABAR_LUT_BITS = np.full((256, 10), 255, dtype=np.uint8)
+_CODABAR_LUT_LEN = np.zeros(256, dtype=np.uint8)
+for _key, _pattern in CODABAR_NP.items():
+    _CODABAR_LUT_BITS[ord(_key), :len(_pattern)] = _pattern
+    _CODABAR_LUT_LEN[ord(_key)] = len(_pattern)
+
+def _encode_codabar_kernel(data_ascii: npt.NDArray[np.uint8], starts: npt.NDArray[np.intp],
+                           out_starts: npt.NDArray[np.intp], out: npt.NDArray[np.uint8]) -> None:
+    '''
+    Writes the bit patterns of many values into out, separated by a 0 bit within each value.
+    Value i spans data_ascii[starts[i]:starts[i + 1]] and is written from out[out_starts[i]].
+    Meant to be compiled with numba, see `_compiled`, which freezes the lookup tables as constants.
+    '''
+    for item in range(starts.size - 1):
+        offset = out_starts[item]
+        for index in range(starts[item], starts[item + 1]):
+            token = data_ascii[index]
+            if index > starts[item]:
+                out[offset] = 0
+                offset += 1
+            for bit in range(_CODABAR_LUT_LEN[token]):
+                out[offset] = _CODABAR_LUT_BITS[token, bit]
+                offset += 1
+
+@functools.lru_cache(maxsize=None)
+def _compiled(kernel: Callable[..., None]) -> Callable[..., None] | None:
+    '''
+    Compiles a kernel with numba, importing numba on first use.
+
+    Parameters
+    ----------
+        kernel : Callable[..., None]
+            A numba compatible function
+
+    Returns
+    -------
+        Callable[..., None] | None
+            The compiled kernel, or None if numba is not installed
+    '''
+    try:
+        import numba # type: ignore # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    compiled: Callable[..., None] = numba.njit(cache=True)(kernel)
+    return compiled
+
+def _encode_codabar_batch(barcodes: list[Barcode]) -> list[npt.NDArray[np.uint8]]:
+    '''
+    Encodes many barcodes into NumPy arrays of binary digits.
+    Codabar barcodes go through the compiled kernel when numba is installed,
+    encoding each distinct value once; otherwise the cached `encode_array` is used.
+
+    Parameters
+    ----------
+        barcodes : list[Barcode]
+            The barcodes to encode
+
+    Returns
+    -------
+        list[npt.NDArray[np.uint8]]
+            The encoded data of each barcode
+    '''
+    codabars = [barcode for barcode in barcodes if isinstance(barcode, Codabar)]
+    kernel = _compiled(_encode_codabar_kernel) if codabars else None
+    if kernel is None:
+        return [barcode.encode_array() for barcode in barcodes]
+
+    # Encode every distinct Codabar value in one kernel call over a single ASCII buffer
+    values = list(dict.fromkeys([barcode.data for barcode in codabars]))
+    data_ascii = np.frombuffer(''.join(values).encode('ascii'), dtype=np.uint8)
+    lengths = np.array([len(value) for value in values], dtype=np.intp)
+    starts = np.zeros(lengths.size + 1, dtype=np.intp)
+    np.cumsum(lengths, out=starts[1:])
+    sizes = np.add.reduceat(_CODABAR_LUT_LEN[data_ascii].astype(np.intp), starts[:-1]) + lengths - 1
+    out_starts = np.zeros(sizes.size + 1, dtype=np.intp)
+    np.cumsum(sizes, out=out_starts[1:])
+    out = np.empty(out_starts[-1], dtype=np.uint8)
+    kernel(data_ascii, starts, out_starts, out)
+
+    # Repeated values share one array, so it is made read-only
+    out.setflags(write=False)
+    encoded_values = dict(zip(values, np.split(out, out_starts[1:-1])))
+    return [encoded_values[barcode.data] if isinstance(barcode, Codabar)
+            else barcode.encode_array()
+            for barcode in barcodes]
+
+# Bit patterns as integers (most significant bit first) for the packed encoder
+_CODABAR_LUT_PATTERN = np.zeros(256, dtype=np.uint16)
+for _key, _value in CODABAR_DICT.items():
+    _CODABAR_LUT_PATTERN[ord(_key)] = int(_value, 2)
+
+def _pack_codabar(data_ascii: npt.NDArray[np.uint8], lut_pattern: npt.NDArray[np.uint16],
+                  lut_len: npt.NDArray[np.uint8], out: npt.NDArray[np.uint8]) -> None:
+    '''
+    Writes the bit patterns of the ASCII symbols into out as packed bytes, separated by a 0 bit.
+    Patterns are shifted into an accumulator which is drained a byte at a time.
+    Meant to be compiled with numba, see `_compiled`.
+    '''
+    acc = 0
+    nbits = 0
+    offset = 0
+    for index in range(data_ascii.size):
+        token = data_ascii[index]
+        width = int(lut_len[token])
+        if index > 0:
+            width += 1
+        acc = (acc << width) | int(lut_pattern[token])
+        nbits += width
+        while nbits >= 8:
+            nbits -= 8
+            out[offset] = (acc >> nbits) & 0xFF
+            offset += 1
+            acc &= (1 << nbits) - 1
+    if nbits > 0:
+        out[offset] = (acc << (8 - nbits)) & 0xFF
+
+@functools.lru_cache(maxsize=1024)
+def _encode_codabar(data: str) -> str:
+    '''
+    Encodes wrapped Codabar data into a string of binary digits, caching the result.
+
+    Parameters
+    ----------
+        data : str
+            Codabar data, including start and stop characters
+
+    Returns
+    -------
+        str
+            The encoded data
+    '''
+    return '0'.join([_CODABAR_LUT[token] for token in data.encode('ascii')])
+
 # See:
 # - https://en.wikipedia.org/wiki/Codabar
 # - https://www.dcode.fr/barcode-codabar
@@ -186,12 +364,17 @@ class Codabar(Barcode):
             Determines if the data is valid
         encode():
             Encodes the data into an array of binary digits.
+        encode_packed():
+            Encodes the data into binary digits packed into bytes.
     """
 
+    __slots__ = ('_stripped',)
+
     def __init__(self, data: str, options: dict[str, Any]):
         if not self.is_valid(data):
             raise ValueError(f"Not a valid codabar value: {data}")
-        super().__init__(f"A{data}A".upper(), options, 'codabar')
+        super().__init__('A' + data + 'A', options, 'codabar')
+        self._stripped = self._data.translate(_CODABAR_STRIP)
 
     def is_valid(self, data: str) -> bool:
         '''
@@ -207,7 +390,7 @@ class Codabar(Barcode):
             boolean
                 The encoded data
         '''
-        return re.search(r'^[0-9\-\$\:\.\+\/]+$', data) is not None
+        return _CODABAR_RE.match(data) is not None
 
     # @override
     @property
@@ -220,7 +403,7 @@ class Codabar(Barcode):
             str
                 The barcode text.
         """
-        return self.options.get('text', re.sub(r"[A-D]", "", self.data))
+        return self.options.get('text', self._stripped)
 
     # @override
     def encode(self) -> str:
@@ -232,7 +415,68 @@ class Codabar(Barcode):
             str
                 The encoded data
         '''
-        return '0'.join([CODABAR_DICT[token] for token in self.data])
+        return _encode_codabar(self.data)
+
+    # @override
+    def encode_array(self) -> npt.NDArray[np.uint8]:
+        '''
+        Encodes the data into a NumPy array of binary digits.
+
+        Returns
+        -------
+            npt.NDArray[np.uint8]
+                The encoded data
+        '''
+        return str_to_digits(_encode_codabar(self.data))
+
+    def encode_packed(self) -> tuple[npt.NDArray[np.uint8], int]:
+        '''
+        Encodes the data into binary digits packed eight to a byte, most significant bit first.
+        Uses a compiled kernel when numba is installed, otherwise
+        `np.packbits(self.encode_array())`.
+
+        Returns
+        -------
+            tuple[npt.NDArray[np.uint8], int]
+                The packed data and the number of encoded bits
+        '''
+        kernel = _compiled(_pack_codabar)
+        if kernel is None:
+            encoded = self.encode_array()
+            return np.packbits(encoded), encoded.size
+        data_ascii = np.frombuffer(self.data.encode('ascii'), dtype=np.uint8)
+        nbits = int(_CODABAR_LUT_LEN[data_ascii].sum()) + data_ascii.size - 1
+        out = np.zeros((nbits + 7) // 8, dtype=np.uint8)
+        kernel(data_ascii, _CODABAR_LUT_PATTERN, _CODABAR_LUT_LEN, out)
+        return out, nbits
+
+# See:
+# - https://github.com/lindell/JsBarcode/blob/master/src/barcodes/EAN_UPC/constants.js
+
+UPC_L_CODE = str_to_digits(''.join([
+    "0001101", "0011001", "0010011", "0111101", "0100011",
+    "0110001", "0101111", "0111011", "0110111", "0001011"
+])).reshape(10, 7)
+UPC_R_CODE = 1 - UPC_L_CODE
+UPC_GUARD = str_to_digits("101")
+UPC_MIDDLE = str_to_digits("01010")
+
+def upc_check_digit(digits: npt.NDArray[np.uint8]) -> int:
+    '''
+    Computes the UPC check digit.
+
+    Parameters
+    ----------
+        digits : npt.NDArray[np.uint8]
+            The first 11 digits
+
+    Returns
+    -------
+        int
+            The check digit
+    '''
+    total = 3 * int(digits[0:11:2].sum()) + int(digits[1:11:2].sum())
+    return (10 - total % 10) % 10
 
 # See:
 # - https://en.wikipedia.org/wiki/Universal_Product_Code
@@ -258,10 +502,18 @@ class Upc(Barcode):
             Encodes the data into an array of binary digits.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: str, options: dict[str, Any]):
         if not self.is_valid(data):
             raise ValueError(f"Not a valid UPC value: {data}")
-        super().__init__(data, options, 'codabar')
+        digits = str_to_digits(data)
+        check_digit = upc_check_digit(digits)
+        if len(data) == 11:
+            data += str(check_digit)
+        elif check_digit != digits[11]:
+            raise ValueError(f"Not a valid UPC check digit: {data}, expected {check_digit}")
+        super().__init__(data, options, 'upc')
 
     def is_valid(self, data: str) -> bool:
         '''
@@ -277,7 +529,7 @@ class Upc(Barcode):
             boolean
                 The encoded data
         '''
-        return re.search(r'^[0-9]{11,12}$', data) is not None
+        return _UPC_RE.match(data) is not None
 
     # @override
     def encode(self) -> str:
@@ -289,12 +541,53 @@ class Upc(Barcode):
             str
                 The encoded data
         '''
-        return "" # implement
+        return (self.encode_array() + ord('0')).tobytes().decode('ascii')
+
+    # @override
+    def encode_array(self) -> npt.NDArray[np.uint8]:
+        '''
+        Encodes the data into a NumPy array of binary digits.
+
+        Returns
+        -------
+            npt.NDArray[np.uint8]
+                The encoded data
+        '''
+        digits = str_to_digits(self.data)
+        return np.concatenate((UPC_GUARD,
+                               UPC_L_CODE[digits[:6]].ravel(),
+                               UPC_MIDDLE,
+                               UPC_R_CODE[digits[6:]].ravel(),
+                               UPC_GUARD))
+
+BARCODE_TYPES: dict[str, type[Codabar] | type[Upc]] = {
+    'codabar': Codabar,
+    'upc': Upc
+}
 
 U = TypeVar('U', bound=Barcode)
 
+def export_filename(directory: str, barcode: U) -> str:
+    '''
+    Returns the default image path of a barcode.
+
+    Parameters
+    ----------
+        directory : str
+            Directory of the image
+        barcode : Barcode
+            An instance of a Barcode
+
+    Returns
+    -------
+        str
+            The image path, with path separators in the data replaced by underscores
+    '''
+    return f"{directory}{os.sep}{barcode.name}-{barcode.data.translate(_FILENAME_SAFE)}.png"
+
 # See: https://matplotlib.org/stable/gallery/images_contours_and_fields/barcode_demo.html
-def create_barcode(barcode: U, filename: str, dpi: int) -> list[int]:
+def create_barcode(barcode: U, filename: str, dpi: int,
+                   encoded: npt.NDArray[np.uint8] | None = None) -> npt.NDArray[np.uint8]:
     '''
     Returns the encoded barcode data and saves an image.
 
@@ -306,30 +599,214 @@ def create_barcode(barcode: U, filename: str, dpi: int) -> list[int]:
             Filename of image
         dpi : int
             DPI or dots per inch
+        encoded : npt.NDArray[np.uint8] | None
+            Already encoded data, defaults to `barcode.encode_array()`
 
     Returns
     -------
-        encoded : list[int]
+        encoded : npt.NDArray[np.uint8]
             The encoded data
     '''
-    encoded = str_to_digits(barcode.encode())
+    if encoded is None:
+        encoded = barcode.encode_array()
     pixel_per_bar = 4
-    fig = plt.figure(figsize=(len(encoded) * pixel_per_bar / dpi, 2), dpi=dpi)
-    ax = fig.add_axes([0.1, 0.25, 0.8, 0.5])  # span the whole figure
-    plt.xticks([])
-    plt.yticks([])
-    ax.spines[['top', 'right', 'bottom', 'left']].set_visible(False)
-    ax.set_xlabel(barcode.text, fontsize='large', fontweight='bold')
-    ax.imshow(np.array(encoded).reshape(1, -1),
-                cmap='binary',
-                aspect='auto',
-                interpolation='nearest')
-    export_path = filename or os.path.join(EXPORT_DIR, f"{barcode.name}-{barcode.data}.png")
-    pathlib.Path(EXPORT_DIR).mkdir(parents=True, exist_ok=True)
-    plt.savefig(export_path)
+    if filename:
+        export_path = filename
+        create_dir(os.path.dirname(filename) or os.curdir)
+    else:
+        export_path = export_filename(EXPORT_DIR, barcode)
+        create_dir(EXPORT_DIR)
+    if barcode.text:
+        _save_labeled_image(encoded, barcode.text, export_path, pixel_per_bar, dpi)
+    else:
+        _save_plain_image(encoded, export_path, pixel_per_bar, dpi)
     print(f"Successfully created barcode: {export_path}")
     return encoded
 
+# pylint: disable-next=too-many-arguments
+def create_barcodes(values: Iterable[str], out_dir: str, dpi: int, *,
+                    barcode_type: Callable[[str, dict[str, Any]], Barcode] = Codabar,
+                    options: dict[str, Any] | None = None,
+                    workers: int = 1) -> list[npt.NDArray[np.uint8]]:
+    '''
+    Returns the encoded data of many barcodes and saves an image for each.
+    Codabar data is encoded with numba when it is installed, images of the same
+    size share one figure, and with more than one worker the renders are spread
+    across processes. Values that map to the same image are only saved once.
+
+    Parameters
+    ----------
+        values : Iterable[str]
+            Data for each barcode
+        out_dir : str
+            Directory of the images
+        dpi : int
+            DPI or dots per inch
+        barcode_type : Callable[[str, dict[str, Any]], Barcode]
+            Barcode class to create, defaults to Codabar
+        options : dict[str, Any] | None
+            Options of every barcode, e.g. {'text': ''} to save the bars without text
+        workers : int
+            Number of processes to render with
+
+    Returns
+    -------
+        list[npt.NDArray[np.uint8]]
+            The encoded data of each barcode
+    '''
+    barcodes = [barcode_type(value, dict(options or {})) for value in values]
+    filenames = [export_filename(out_dir, barcode) for barcode in barcodes]
+    encoded = _encode_codabar_batch(barcodes)
+    create_dir(out_dir)
+
+    # Save each image path once, so no two workers write the same file
+    first: dict[str, int] = {}
+    for index, filename in enumerate(filenames):
+        first.setdefault(filename, index)
+    unique = list(first.values())
+    if workers > 1:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(create_barcode,
+                              [barcodes[index] for index in unique],
+                              [filenames[index] for index in unique],
+                              repeat(dpi),
+                              [encoded[index] for index in unique],
+                              chunksize=max(1, len(unique) // (workers * 4))))
+    else:
+        for index in unique:
+            create_barcode(barcodes[index], filenames[index], dpi, encoded[index])
+    return encoded
+
+def _to_grayscale(encoded: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    '''
+    Converts binary digits to grayscale pixel values, black bars on white.
+
+    Parameters
+    ----------
+        encoded : npt.NDArray[np.uint8]
+            The encoded data
+
+    Returns
+    -------
+        npt.NDArray[np.uint8]
+            The pixel values
+    '''
+    return np.where(encoded == 1, 0, 255).astype(np.uint8)
+
+def _expand_bars(encoded: npt.NDArray[np.uint8], pixel_per_bar: int,
+                 height: int) -> npt.NDArray[np.uint8]:
+    '''
+    Expands the encoded data into a full grayscale image, one pixel per output pixel.
+    The rows are a broadcast view of a single row, so no memory is used for the height.
+
+    Parameters
+    ----------
+        encoded : npt.NDArray[np.uint8]
+            The encoded data
+        pixel_per_bar : int
+            Width of a single bar in pixels
+        height : int
+            Height of the bars in pixels
+
+    Returns
+    -------
+        npt.NDArray[np.uint8]
+            The image pixels, of shape (height, len(encoded) * pixel_per_bar)
+    '''
+    row = np.repeat(_to_grayscale(encoded), pixel_per_bar)
+    return np.broadcast_to(row, (height, row.size))
+
+def _save_labeled_image(encoded: npt.NDArray[np.uint8], text: str, export_path: str,
+                        pixel_per_bar: int, dpi: int) -> None:
+    '''
+    Saves the encoded data as a PNG with the text drawn underneath, using matplotlib.
+
+    Parameters
+    ----------
+        encoded : npt.NDArray[np.uint8]
+            The encoded data
+        text : str
+            Text to draw under the bars
+        export_path : str
+            Path of the image
+        pixel_per_bar : int
+            Width of a single bar in pixels
+        dpi : int
+            DPI or dots per inch
+    '''
+    pixels = _expand_bars(encoded, pixel_per_bar, dpi)
+    with _RENDER_LOCK:
+        canvas, image = _get_figure(pixels.shape[1], dpi)
+        image.set_data(pixels)
+        image.axes.set_xlabel(text, fontsize='large', fontweight='bold')
+        canvas.print_png(export_path, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+
+@functools.lru_cache(maxsize=4)
+def _get_figure(width: int, dpi: int) -> tuple[Any, Any]:
+    '''
+    Returns a cached figure canvas and image artist for bars of the given size,
+    creating them on first use. Only the most recently used sizes are kept.
+
+    Parameters
+    ----------
+        width : int
+            Width of the bars in pixels
+        dpi : int
+            DPI or dots per inch, also used as the bar height in pixels
+
+    Returns
+    -------
+        tuple[FigureCanvasAgg, AxesImage]
+            The canvas to print and the image to update
+    '''
+    # pylint: disable=import-outside-toplevel
+    from matplotlib.backends.backend_agg import FigureCanvasAgg # type: ignore
+    from matplotlib.figure import Figure # type: ignore
+
+    # Size the figure so the axes are exactly as wide as the expanded bars and start
+    # on a whole pixel, letting the image be drawn without resampling
+    margin = round(0.125 * width)
+    fig_width = width + 2 * margin
+    fig = Figure(figsize=(fig_width / dpi, 2), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((margin / fig_width, 0.25, width / fig_width, 0.5))
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.spines[['top', 'right', 'bottom', 'left']].set_visible(False)
+    image = ax.imshow(np.zeros((dpi, width), dtype=np.uint8),
+                        cmap='gray',
+                        aspect='equal',
+                        interpolation='none',
+                        vmin=0,
+                        vmax=255)
+    return canvas, image
+
+def _save_plain_image(encoded: npt.NDArray[np.uint8], export_path: str,
+                      pixel_per_bar: int, dpi: int) -> None:
+    '''
+    Saves the encoded data as a bare grayscale PNG, using Pillow.
+
+    Parameters
+    ----------
+        encoded : npt.NDArray[np.uint8]
+            The encoded data
+        export_path : str
+            Path of the image
+        pixel_per_bar : int
+            Width of a single bar in pixels
+        dpi : int
+            DPI or dots per inch, also used as the bar height in pixels
+    '''
+    # pylint: disable=import-outside-toplevel
+    from PIL import Image # type: ignore
+
+    pixels = np.ascontiguousarray(_expand_bars(encoded, pixel_per_bar, dpi))
+    Image.fromarray(pixels).save(export_path, optimize=False,
+                                 compress_level=PNG_COMPRESS_LEVEL)
+
 def main(args: Namespace) -> None:
     '''
     Main entry point.
@@ -341,7 +818,9 @@ def main(args: Namespace) -> None:
     '''
     if args.verbose:
         print(f"Generating a {args.type} barcode from the value: {args.value}")
-    create_barcode(Codabar(args.value, {}), args.filename, args.dpi)
+    options = {'text': ''} if args.no_text else {}
+    barcode = BARCODE_TYPES[args.type](args.value, options)
+    create_barcode(barcode, args.filename, args.dpi)
 
 def parse_arguments() -> Namespace:
     '''
@@ -356,9 +835,10 @@ def parse_arguments() -> Namespace:
                             description='Generates Barcodes',
                             epilog='<EOL>')
     parser.add_argument('value')
-    parser.add_argument('-d', '--dpi', default=100)
+    parser.add_argument('-d', '--dpi', type=int, default=100)
     parser.add_argument('-f', '--filename')
-    parser.add_argument('-t', '--type', choices=['codabar', 'ean', 'upc'], default='codabar')
+    parser.add_argument('-t', '--type', choices=list(BARCODE_TYPES), default='codabar')
+    parser.add_argument('-n', '--no-text', action='store_true')
     parser.add_argument('-v', '--verbose', action='store_true')
 
     return parser.parse_args()